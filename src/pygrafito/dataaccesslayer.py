@@ -1,10 +1,11 @@
 """
 Provide a data access layer for a property graph database using SQLite.
 
-This module defines the core types and the `GraphDB` class for managing
-nodes, edges, and their properties in a property graph model. It supports
-creation, querying, updating, and deletion of graph entities, and is
-designed to be used as a context manager.
+This module defines the `GraphDB` class for managing nodes, edges, and
+their properties in a property graph model. It supports creation,
+querying, updating, and deletion of graph entities, and is designed to be
+used as a context manager. The entity types are defined in
+`pygrafito.entities` and re-exported here.
 
 Classes
 -------
@@ -20,14 +21,27 @@ GraphDB
     Main data access layer for the property graph database.
 """
 
+import contextlib
 import importlib.resources
-import itertools
-import json
 import sqlite3
 from collections.abc import Iterator
-from enum import StrEnum
 from pathlib import Path
-from typing import Any, Callable, Literal, Self, TypedDict, overload
+from typing import Any, Self
+
+from .entities import ENTITY_CONFIG, EdgeDict, EntityConfigDict, EntityType, NodeDict
+from .jsoncodec import dumps, loads
+from .sqlbuilder import (
+    bucket_size,
+    build_fetch_sql,
+    build_find_edges_query,
+    build_find_nodes_query,
+    build_remove_properties_sql,
+    build_set_properties_sql,
+    has_json_path,
+    json_path,
+    rebuild_edges,
+    rebuild_nodes,
+)
 
 __all__ = [
     "NodeDict",
@@ -38,141 +52,25 @@ __all__ = [
 ]
 
 
-class NodeDict(TypedDict):
-    """
-    Represent the structure of a node in a property graph.
-
-    Attributes
-    ----------
-    id : int
-        Unique identifier for the node.
-    label : str
-        Label or name of the node.
-    properties : dict[str, Any]
-        Dictionary containing additional properties or metadata
-        associated with the node.
-    """
-
-    id: int
-    label: str
-    properties: dict[str, Any]
+# The schema script, read once at import time. It is None when this module
+# is not imported as part of a package, as the resource cannot be located.
+_SCHEMA_SQL = (
+    (importlib.resources.files(__package__) / "schema.sql").read_text(encoding="utf-8")
+    if __package__
+    else None
+)
 
 
-class EdgeDict(TypedDict):
-    """
-    Represent the structure of an edge in a property graph.
-
-    Attributes
-    ----------
-    id : int
-        Unique identifier for the edge.
-    source_id : int
-        Unique identifier of the source node of the edge.
-    target_id : int
-        Unique identifier of the target node of the edge.
-    label : str
-        Label describing the edge.
-    properties : dict[str, Any]
-        Dictionary containing additional properties of the edge.
-    """
-
-    id: int
-    source_id: int
-    target_id: int
-    label: str
-    properties: dict[str, Any]
-
-
-class EntityType(StrEnum):
-    """
-    Enumerate entity types in the property graph.
-
-    Members
-    -------
-    NODE : str
-        Represents a node entity.
-    EDGE : str
-        Represents an edge entity.
-    GRAPH : str
-        Represents the graph itself (for graph-level properties).
-    """
-
-    NODE = "node"
-    EDGE = "edge"
-    GRAPH = "graph"
-
-
-class EntityConfigDict(TypedDict):
-    """
-    Describe the configuration for an entity type in the property graph.
-
-    Attributes
-    ----------
-    table : str
-        Table name for the entity.
-    alias : str
-        Table alias for SQL queries.
-    id_col : str
-        Primary key column name for the entity.
-    props_table : str
-        Table name for the entity's properties.
-    sql_fetch_select : str
-        SQL SELECT clause for fetching the entity.
-    sql_fetch_from : str
-        SQL FROM clause for fetching the entity.
-    sql_fetch_join_on : str
-        SQL JOIN ON clause for joining properties.
-    reconstructor : Callable[[Any], NodeDict | EdgeDict]
-        Function to reconstruct the entity from a database row.
-    props_builder : Callable[[NodeDict | EdgeDict, str, str], None]
-        Function to add a property to the entity from a key-value pair.
-    """
-
-    table: str
-    alias: str
-    id_col: str
-    props_table: str
-    sql_fetch_select: str
-    sql_fetch_from: str
-    sql_fetch_join_on: str
-    reconstructor: Callable[[Any], NodeDict | EdgeDict]
-    props_builder: Callable[[NodeDict | EdgeDict, str, str], None]
-
-
-# Configuration for entity types in the property graph.
-# This dictionary maps each EntityType to its configuration metadata.
-# It includes table names, column names, SQL query fragments, and
-# functions for reconstructing entities and building properties.
-_ENTITY_CONFIG: dict[EntityType, EntityConfigDict] = {
-    EntityType.NODE: {
-        "table": "nodes",
-        "alias": "n",
-        "id_col": "node_id",
-        "props_table": "node_properties",
-        "sql_fetch_select": "n.node_id, n.label",
-        "sql_fetch_from": "nodes AS n",
-        "sql_fetch_join_on": "n.node_id = np.node_id",
-        "reconstructor": lambda row: NodeDict(id=row[0], label=row[1], properties={}),
-        "props_builder": lambda entity, key, value: entity["properties"].__setitem__(
-            key, json.loads(value)
-        ),
-    },
-    EntityType.EDGE: {
-        "table": "edges",
-        "alias": "e",
-        "id_col": "edge_id",
-        "props_table": "edge_properties",
-        "sql_fetch_select": "e.edge_id, e.source_id, e.target_id, e.label",
-        "sql_fetch_from": "edges AS e",
-        "sql_fetch_join_on": "e.edge_id = ep.edge_id",
-        "reconstructor": lambda row: EdgeDict(
-            id=row[0], source_id=row[1], target_id=row[2], label=row[3], properties={}
-        ),
-        "props_builder": lambda entity, key, value: entity["properties"].__setitem__(
-            key, json.loads(value)
-        ),
-    },
-}
+# Connection settings applied by `GraphDB.connect` when ``fast`` is enabled.
+# With WAL journaling, synchronous=NORMAL only syncs at checkpoints while
+# staying consistent across application crashes. The page cache (64 MiB)
+# and memory map (256 MiB) keep hot pages in memory.
+_FAST_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -65536;",
+    "PRAGMA mmap_size = 268435456;",
+)
 
 
 class GraphDB:
@@ -187,9 +85,12 @@ class GraphDB:
     ----------
     db_path : Path or str
         Path to the SQLite database file.
+    fast : bool, optional
+        Whether to tune the connection for throughput (WAL journal,
+        ``synchronous=NORMAL``, larger page cache). Defaults to True.
     """
 
-    def __init__(self, db_path: Path | str) -> None:
+    def __init__(self, db_path: Path | str, fast: bool = True) -> None:
         """
         Initialize the GraphDB with the given database path.
 
@@ -197,9 +98,14 @@ class GraphDB:
         ----------
         db_path : Path or str
             Path to the SQLite database file.
+        fast : bool, optional
+            Whether to tune the connection for throughput (WAL journal,
+            ``synchronous=NORMAL``, larger page cache). Defaults to True.
         """
         self.db_path = Path(db_path)
+        self.fast = fast
         self._connection: sqlite3.Connection | None = None
+        self._cursor: sqlite3.Cursor | None = None
 
     def connect(self) -> None:
         """
@@ -211,15 +117,77 @@ class GraphDB:
             If the schema resource cannot be found.
         """
         if self._connection is None:
-            self._connection = sqlite3.connect(self.db_path)
-            self._connection.execute("PRAGMA foreign_keys = ON;")
+            self._connection = self._open_connection()
             self._initialize_schema()
 
+    @classmethod
+    def from_template(
+        cls, template: "GraphDB", db_path: Path | str = ":memory:", fast: bool = True
+    ) -> Self:
+        """
+        Create a connected GraphDB holding a copy of another database.
+
+        The copy is made with the SQLite online backup API, which copies
+        database pages directly instead of replaying the schema script.
+        This makes it a cheap way to stamp out many databases sharing the
+        same initial contents, such as fresh in-memory databases in tests.
+
+        Parameters
+        ----------
+        template : GraphDB
+            A connected GraphDB whose contents are copied.
+        db_path : Path or str, optional
+            Path to the SQLite database file receiving the copy. Defaults
+            to a new in-memory database.
+        fast : bool, optional
+            Whether to tune the new connection for throughput. Defaults to
+            True.
+
+        Returns
+        -------
+        Self
+            A connected GraphDB holding the copied database.
+
+        Raises
+        ------
+        RuntimeError
+            If the template's database connection is not available.
+        """
+        source = template._validate_connection()  # pylint: disable=protected-access
+        graph_db = cls(db_path, fast=fast)
+        connection = graph_db._open_connection()
+        source.backup(connection)
+        graph_db._connection = connection
+        return graph_db
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Open and configure a connection to the SQLite database.
+
+        Returns
+        -------
+        sqlite3.Connection
+            The new connection, with foreign keys enforced and, when
+            ``fast`` is enabled, the throughput PRAGMAs applied.
+        """
+        connection = sqlite3.connect(self.db_path, cached_statements=256)
+        connection.execute("PRAGMA foreign_keys = ON;")
+        if self.fast:
+            if str(self.db_path) != ":memory:":
+                connection.execute("PRAGMA journal_mode = WAL;")
+            for pragma in _FAST_PRAGMAS:
+                connection.execute(pragma)
+        return connection
+
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connection, refreshing planner statistics first."""
         if self._connection:
-            self._connection.close()
-            self._connection = None
+            self._cursor = None
+            try:
+                self._connection.execute("PRAGMA optimize;")
+            finally:
+                self._connection.close()
+                self._connection = None
 
     def _validate_connection(self) -> sqlite3.Connection:
         """
@@ -242,23 +210,57 @@ class GraphDB:
             )
         return self._connection
 
+    def _validate_cursor(self) -> sqlite3.Cursor:
+        """
+        Check if the database connection is established and return its cursor.
+
+        The cursor is created on first use and shared by every statement
+        whose results are consumed before the method returns. Methods
+        returning lazy iterators open their own cursor, so that later calls
+        cannot reset them mid-iteration.
+
+        Returns
+        -------
+        sqlite3.Cursor
+            The long-lived cursor of the active database connection.
+
+        Raises
+        ------
+        RuntimeError
+            If the connection is not available.
+        """
+        connection = self._validate_connection()
+        if self._cursor is None:
+            self._cursor = connection.cursor()
+        return self._cursor
+
     def _initialize_schema(self) -> None:
         """
         Initialize the database schema from the schema.sql resource file.
 
+        The script sets ``PRAGMA user_version``; databases where it is
+        already nonzero have been initialized and are left untouched.
+
         Raises
         ------
         ImportError
             If the schema resource cannot be found.
         """
         connection = self._validate_connection()
-        if not __package__:
+        if _SCHEMA_SQL is None:
             raise ImportError(
                 "This module must be run as part of a package to find schema."
             )
-        with (importlib.resources.files(__package__) / "schema.sql").open("r") as f:
-            schema_sql = f.read()
-        connection.executescript(schema_sql)
+        if connection.execute("PRAGMA user_version;").fetchone()[0]:
+            return
+        connection.executescript(_SCHEMA_SQL)
+        # Gather planner statistics once; `close` keeps them fresh afterwards
+        # through PRAGMA optimize.
+        has_stats = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            connection.execute("ANALYZE;")
 
     def create_node(self, label: str, properties: dict[str, Any] | None = None) -> int:
         """
@@ -279,22 +281,50 @@ class GraphDB:
         Raises
         ------
         RuntimeError
-            If the database connection is not available or node creation fails.
+            If the database connection is not available.
+
+        See Also
+        --------
+        create_nodes : Create many nodes in a single transaction.
         """
-        connection = self._validate_connection()
-        with connection:
-            cursor = connection.cursor()
-            cursor.execute("INSERT INTO nodes (label) VALUES (?)", (label,))
-            node_id = cursor.lastrowid
-            if node_id is None:
-                raise RuntimeError("Failed to retrieve lastrowid after node insertion.")
-            if properties:
-                self.set_properties(
-                    entity_type=EntityType.NODE,
-                    properties=properties,
-                    entity_id=node_id,
-                )
-        return node_id
+        return self.create_nodes([(label, properties)])[0]
+
+    def create_nodes(self, nodes: list[tuple[str, dict[str, Any] | None]]) -> list[int]:
+        """
+        Create several nodes in a single transaction.
+
+        Every transaction costs at least one journal sync on disk-backed
+        databases, so callers inserting many nodes should batch them here
+        rather than calling `create_node` in a loop. The whole batch is
+        bound as a single JSON array and inserted by one statement.
+
+        Parameters
+        ----------
+        nodes : list[tuple[str, dict[str, Any] | None]]
+            The ``(label, properties)`` pairs of the nodes to create.
+
+        Returns
+        -------
+        list[int]
+            The IDs of the newly created nodes, in input order.
+
+        Raises
+        ------
+        RuntimeError
+            If the database connection is not available.
+        """
+        cursor = self._validate_cursor()
+        sql = """
+            INSERT INTO nodes (label, properties)
+            SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]')
+            FROM json_each(?)
+            RETURNING node_id
+        """
+        payload = dumps([[label, properties or {}] for label, properties in nodes])
+        with cursor.connection:
+            cursor.execute(sql, (payload,))
+            # IDs are assigned in array order; RETURNING order is unspecified.
+            return sorted(row[0] for row in cursor.fetchall())
 
     def create_edge(
         self,
@@ -325,143 +355,156 @@ class GraphDB:
         Raises
         ------
         RuntimeError
-            If the database connection is not available or edge creation fails.
+            If the database connection is not available.
+
+        See Also
+        --------
+        create_edges : Create many edges in a single transaction.
+        """
+        return self.create_edges([(source_node_id, target_id, label, properties)])[0]
+
+    def create_edges(
+        self, edges: list[tuple[int, int, str, dict[str, Any] | None]]
+    ) -> list[int]:
+        """
+        Create several edges in a single transaction.
+
+        Callers inserting many edges should batch them here rather than
+        calling `create_edge` in a loop. The whole batch is bound as a
+        single JSON array and inserted by one statement.
+
+        Parameters
+        ----------
+        edges : list[tuple[int, int, str, dict[str, Any] | None]]
+            The ``(source_node_id, target_id, label, properties)`` tuples of
+            the edges to create.
+
+        Returns
+        -------
+        list[int]
+            The IDs of the newly created edges, in input order.
+
+        Raises
+        ------
+        RuntimeError
+            If the database connection is not available.
+        sqlite3.IntegrityError
+            If a source or target node does not exist. No edge is created.
+        """
+        cursor = self._validate_cursor()
+        sql = """
+            INSERT INTO edges (source_id, target_id, label, properties)
+            SELECT
+                json_extract(value, '$[0]'),
+                json_extract(value, '$[1]'),
+                json_extract(value, '$[2]'),
+                json_extract(value, '$[3]')
+            FROM json_each(?)
+            RETURNING edge_id
+        """
+        payload = dumps(
+            [
+                [source_id, target_id, label, properties or {}]
+                for source_id, target_id, label, properties in edges
+            ]
+        )
+        with cursor.connection:
+            cursor.execute(sql, (payload,))
+            # IDs are assigned in array order; RETURNING order is unspecified.
+            return sorted(row[0] for row in cursor.fetchall())
+
+    def _fetch_rows(
+        self, entity_type: EntityType, entity_ids: list[int]
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Fetch the rows of nodes or edges from the database by their IDs.
+
+        Parameters
+        ----------
+        entity_type : EntityType
+            The type of entity to fetch (NODE or EDGE).
+        entity_ids : list of int
+            The list of entity IDs to fetch.
+
+        Returns
+        -------
+        Iterator[tuple[Any, ...]]
+            An iterator over rows with the entity's ``sql_fetch_select`` columns.
         """
         connection = self._validate_connection()
-        with connection:
-            cursor = connection.cursor()
-            cursor.execute(
-                "INSERT INTO edges (source_id, target_id, label) VALUES (?, ?, ?)",
-                (source_node_id, target_id, label),
-            )
-            edge_id = cursor.lastrowid
-            if edge_id is None:
-                raise RuntimeError("Failed to retrieve lastrowid after edge insertion.")
-            if properties:
-                self.set_properties(
-                    entity_type=EntityType.EDGE,
-                    properties=properties,
-                    entity_id=edge_id,
-                )
-        return edge_id
-
-    @overload
-    def _fetch_and_reconstruct(
-        self, entity_type: Literal[EntityType.NODE], entity_ids: list[int]
-    ) -> list[NodeDict]:
+        if not entity_ids:
+            return iter(())
+
+        size = bucket_size(len(entity_ids))
+        # NULL never matches in an IN list, so it is safe padding.
+        params = [*entity_ids, *[None] * (size - len(entity_ids))]
+        cursor = connection.cursor()
+        cursor.execute(build_fetch_sql(entity_type, size), params)
+        return cursor
+
+    def _fetch_nodes(self, node_ids: list[int]) -> Iterator[NodeDict]:
         """
         Fetch and reconstruct nodes from the database by their IDs.
 
         Parameters
         ----------
-        entity_type : Literal[EntityType.NODE]
-            The type of entity to fetch (NODE).
-        entity_ids : list of int
+        node_ids : list of int
             The list of node IDs to fetch.
 
         Returns
         -------
-        list[NodeDict]
-            A list of reconstructed node dictionaries.
+        Iterator[NodeDict]
+            An iterator over the reconstructed node dictionaries.
         """
+        return rebuild_nodes(self._fetch_rows(EntityType.NODE, node_ids))
 
-    @overload
-    def _fetch_and_reconstruct(
-        self, entity_type: Literal[EntityType.EDGE], entity_ids: list[int]
-    ) -> list[EdgeDict]:
+    def _fetch_edges(self, edge_ids: list[int]) -> Iterator[EdgeDict]:
         """
         Fetch and reconstruct edges from the database by their IDs.
 
         Parameters
         ----------
-        entity_type : Literal[EntityType.EDGE]
-            The type of entity to fetch (EDGE).
-        entity_ids : list of int
+        edge_ids : list of int
             The list of edge IDs to fetch.
 
         Returns
         -------
-        list[EdgeDict]
-            A list of reconstructed edge dictionaries.
+        Iterator[EdgeDict]
+            An iterator over the reconstructed edge dictionaries.
         """
+        return rebuild_edges(self._fetch_rows(EntityType.EDGE, edge_ids))
 
-    def _fetch_and_reconstruct(
-        self, entity_type: EntityType, entity_ids: list[int]
-    ) -> list[NodeDict] | list[EdgeDict]:
+    def get_node(self, node_id: int) -> NodeDict | None:
         """
-        Fetch and reconstruct nodes or edges from the database by their IDs.
+        Get a node by its ID.
 
         Parameters
         ----------
-        entity_type : EntityType
-            The type of entity to fetch (NODE or EDGE).
-        entity_ids : list of int
-            The list of entity IDs to fetch.
+        node_id : int
+            The ID of the node to get.
 
         Returns
         -------
-        list[NodeDict] or list[EdgeDict]
-            A list of reconstructed node or edge dictionaries.
+        NodeDict or None
+            The node dictionary, or None if no node has the given ID.
         """
-        connection = self._validate_connection()
-        if not entity_ids:
-            return []
+        return next(self._fetch_nodes([node_id]), None)
 
-        config = _ENTITY_CONFIG[entity_type]
-        id_placeholders = ",".join("?" * len(entity_ids))
-        props_alias = "ep" if entity_type == EntityType.EDGE else "np"
-        entity_alias = config["alias"]
-
-        sql_fetch = f"""
-            SELECT {config['sql_fetch_select']}, {props_alias}.key, {props_alias}.value
-            FROM {config['sql_fetch_from']}
-            LEFT JOIN {config['props_table']} AS {props_alias} ON {config['sql_fetch_join_on']}
-            WHERE {entity_alias}.{config['id_col']} IN ({id_placeholders})
-            ORDER BY {entity_alias}.{config['id_col']}
+    def get_edge(self, edge_id: int) -> EdgeDict | None:
         """
-        cursor = connection.cursor()
-        cursor.execute(sql_fetch, tuple(entity_ids))
-
-        entities_by_id = {}
-        for row in cursor:
-            entity_id = row[0]
-            if entity_id not in entities_by_id:
-                entities_by_id[entity_id] = config["reconstructor"](row)
-            key, value = row[-2], row[-1]
-            if key is not None:
-                config["props_builder"](entities_by_id[entity_id], key, value)
-        return list(entities_by_id.values())
-
-    def _build_find_nodes_query(
-        self,
-        label: str | None,
-        properties: dict[str, Any] | None,
-    ) -> tuple[str, tuple[Any, ...]]:
-        """Build the SQL query and parameters for finding nodes."""
-        query_params: list[Any] = []
-        if properties:
-            prop_clauses = " OR ".join(
-                ("(np.key = ? AND np.value = ?)" for _ in properties)
-            )
-            prop_params = itertools.chain.from_iterable(
-                (key, json.dumps(value)) for key, value in properties.items()
-            )
-            query_params.extend(prop_params)
-            sql = f"""
-                SELECT np.node_id FROM node_properties AS np
-                {'JOIN nodes AS n ON np.node_id = n.node_id' if label else ''}
-                WHERE ({prop_clauses}) {'AND n.label = ?' if label else ''}
-                GROUP BY np.node_id HAVING COUNT(np.node_id) = ?
-            """
-            if label:
-                query_params.append(label)
-            query_params.append(len(properties))
-        else:
-            # Ensured by find_nodes that label is not None here
-            sql = "SELECT node_id FROM nodes WHERE label = ?"
-            query_params.append(label)
+        Get an edge by its ID.
+
+        Parameters
+        ----------
+        edge_id : int
+            The ID of the edge to get.
 
-        return sql, tuple(query_params)
+        Returns
+        -------
+        EdgeDict or None
+            The edge dictionary, or None if no edge has the given ID.
+        """
+        return next(self._fetch_edges([edge_id]), None)
 
     def find_nodes(
         self, label: str | None = None, properties: dict[str, Any] | None = None
@@ -484,68 +527,52 @@ class GraphDB:
         Raises
         ------
         ValueError
-            If both label and properties are None.
+            If neither a label nor any properties are given.
+
+        See Also
+        --------
+        iter_nodes : Stream the matching nodes instead of building a list.
+        """
+        return list(self.iter_nodes(label, properties))
+
+    def iter_nodes(
+        self, label: str | None = None, properties: dict[str, Any] | None = None
+    ) -> Iterator[NodeDict]:
+        """
+        Iterate over nodes in the graph matching a label and/or properties.
+
+        Nodes are reconstructed as they are read from the database, so
+        callers that stop early or consume the results once avoid holding
+        the whole result set in memory.
+
+        Parameters
+        ----------
+        label : str or None, optional
+            The label of the nodes to find. If None, any label is matched.
+        properties : dict[str, Any] or None, optional
+            Properties that the nodes must have. All must match (AND logic).
+
+        Returns
+        -------
+        Iterator[NodeDict]
+            An iterator over the node dictionaries matching the criteria.
+
+        Raises
+        ------
+        ValueError
+            If neither a label nor any properties are given.
         """
         connection = self._validate_connection()
-        if label is None and properties is None:
+        if label is None and not properties:
             raise ValueError(
                 "At least one of 'label' or 'properties' must be provided."
             )
 
-        sql, params = self._build_find_nodes_query(label, properties)
+        sql, params = build_find_nodes_query(label, properties)
 
         cursor = connection.cursor()
         cursor.execute(sql, params)
-        node_ids = [row[0] for row in cursor]
-
-        return self._fetch_and_reconstruct(EntityType.NODE, node_ids)
-
-    def _build_find_edges_query(
-        self,
-        source_node_id: int | None,
-        target_node_id: int | None,
-        label: str | None,
-        properties: dict[str, Any] | None,
-    ) -> tuple[str, tuple[Any, ...]]:
-        """Build the SQL query and parameters for finding edges."""
-        query_params: list[Any] = []
-        base_where_clauses: list[str] = []
-
-        if source_node_id is not None:
-            base_where_clauses.append("e.source_id = ?")
-            query_params.append(source_node_id)
-        if target_node_id is not None:
-            base_where_clauses.append("e.target_id = ?")
-            query_params.append(target_node_id)
-        if label is not None:
-            base_where_clauses.append("e.label = ?")
-            query_params.append(label)
-
-        if properties:
-            prop_clauses = " OR ".join(
-                ("(ep.key = ? AND ep.value = ?)" for _ in properties)
-            )
-            base_conditions = " AND ".join(base_where_clauses)
-            base_where_sql = f" AND ({base_conditions})" if base_where_clauses else ""
-            sql = f"""
-                SELECT ep.edge_id FROM edge_properties AS ep
-                JOIN edges AS e ON ep.edge_id = e.edge_id
-                WHERE ({prop_clauses}){base_where_sql}
-                GROUP BY ep.edge_id
-                HAVING COUNT(ep.edge_id) = ?
-            """
-            prop_params = itertools.chain.from_iterable(
-                (key, json.dumps(value)) for key, value in properties.items()
-            )
-            final_params: list[Any] = list(prop_params)
-            final_params.extend(query_params)
-            final_params.append(len(properties))
-            return sql, tuple(final_params)
-
-        base_where_sql = " AND ".join(base_where_clauses)
-        where_sql = f"WHERE {base_where_sql}" if base_where_clauses else ""
-        sql = f"SELECT e.edge_id FROM edges AS e {where_sql}"
-        return sql, tuple(query_params)
+        return rebuild_nodes(cursor)
 
     def find_edges(
         self,
@@ -576,21 +603,61 @@ class GraphDB:
         Raises
         ------
         ValueError
-            If all search criteria are None.
+            If all search criteria are None or empty.
+
+        See Also
+        --------
+        iter_edges : Stream the matching edges instead of building a list.
+        """
+        return list(self.iter_edges(source_node_id, target_node_id, label, properties))
+
+    def iter_edges(
+        self,
+        source_node_id: int | None = None,
+        target_node_id: int | None = None,
+        label: str | None = None,
+        properties: dict[str, Any] | None = None,
+    ) -> Iterator[EdgeDict]:
+        """
+        Iterate over edges matching a source, target, label, and/or properties.
+
+        Edges are reconstructed as they are read from the database; see
+        `iter_nodes`.
+
+        Parameters
+        ----------
+        source_node_id : int or None, optional
+            The ID of the source node. If None, any source is matched.
+        target_node_id : int or None, optional
+            The ID of the target node. If None, any target is matched.
+        label : str or None, optional
+            The label of the edge. If None, any label is matched.
+        properties : dict[str, Any] or None, optional
+            Properties that the edges must have. All must match (AND logic).
+
+        Returns
+        -------
+        Iterator[EdgeDict]
+            An iterator over the edge dictionaries matching the criteria.
+
+        Raises
+        ------
+        ValueError
+            If all search criteria are None or empty.
         """
         connection = self._validate_connection()
-        if all(p is None for p in [source_node_id, target_node_id, label, properties]):
+        if not properties and all(
+            p is None for p in [source_node_id, target_node_id, label]
+        ):
             raise ValueError("At least one search criterion must be provided.")
 
-        sql, params = self._build_find_edges_query(
+        sql, params = build_find_edges_query(
             source_node_id, target_node_id, label, properties
         )
 
         cursor = connection.cursor()
         cursor.execute(sql, params)
-        edge_ids = [row[0] for row in cursor]
-
-        return self._fetch_and_reconstruct(EntityType.EDGE, edge_ids)
+        return rebuild_edges(cursor)
 
     def set_properties(
         self,
@@ -609,30 +676,99 @@ class GraphDB:
             The properties to set or update.
         entity_id : int or None
             The ID of the entity (required for NODE and EDGE, ignored for GRAPH).
+
+        Raises
+        ------
+        ValueError
+            If `entity_id` is None for a node or edge.
+        sqlite3.IntegrityError
+            If no node or edge has the given ID.
         """
-        connection = self._validate_connection()
-        data_generator: Iterator[tuple[Any, ...]]
+        cursor = self._validate_cursor()
         if entity_type == EntityType.GRAPH:
             sql = (
                 "INSERT INTO graph_properties (key, value) VALUES (?, ?) "
                 "ON CONFLICT(key) DO UPDATE SET value = excluded.value;"
             )
-            data_generator = ((k, json.dumps(v)) for k, v in properties.items())
+            rows = [(key, dumps(value)) for key, value in properties.items()]
+            with cursor.connection:
+                cursor.executemany(sql, rows)
+            return
+        if entity_id is None:
+            raise ValueError("entity_id must be provided for nodes and edges.")
+        if not properties:
+            return
+        if all(has_json_path(key) for key in properties):
+            size = bucket_size(len(properties))
+            params: list[Any] = []
+            for key, value in properties.items():
+                params.append(json_path(key))
+                params.append(dumps(value))
+            # Setting the same key twice is idempotent, so repeat the last pair.
+            params.extend(params[-2:] * (size - len(properties)))
+            params.append(entity_id)
+            with cursor.connection:
+                cursor.execute(build_set_properties_sql(entity_type, size), params)
+            found = cursor.rowcount > 0
         else:
-            if entity_id is None:
-                raise ValueError("entity_id must be provided for nodes and edges.")
-            config = _ENTITY_CONFIG[entity_type]
-            props_table = config["props_table"]
-            id_col = config["id_col"]
-            sql = (
-                f"INSERT INTO {props_table} ({id_col}, key, value) VALUES (?, ?, ?) "
-                f"ON CONFLICT({id_col}, key) DO UPDATE SET value = excluded.value;"
+            found = self._rewrite_properties(entity_type, entity_id, properties, [])
+        if not found:
+            raise sqlite3.IntegrityError(
+                f"No {entity_type} exists with ID {entity_id}."
             )
-            data_generator = (
-                (entity_id, k, json.dumps(v)) for k, v in properties.items()
+
+    def _rewrite_properties(
+        self,
+        entity_type: EntityType,
+        entity_id: int,
+        properties: dict[str, Any],
+        removed_keys: list[str],
+    ) -> bool:
+        """
+        Set and remove properties of a node or edge by rewriting its object.
+
+        This is the fallback for keys that no JSON path can address (see
+        `has_json_path`): the properties object is read, updated in Python
+        and written back within a single immediate transaction.
+
+        Parameters
+        ----------
+        entity_type : EntityType
+            The type of entity (NODE or EDGE).
+        entity_id : int
+            The ID of the entity.
+        properties : dict[str, Any]
+            The properties to set or update.
+        removed_keys : list[str]
+            The property keys to remove.
+
+        Returns
+        -------
+        bool
+            False if no entity has the given ID, True otherwise.
+        """
+        cursor = self._validate_cursor()
+        config = ENTITY_CONFIG[entity_type]
+        where_sql = f"WHERE {config['id_col']} = ?"
+        with cursor.connection:
+            # Take the write lock before reading, so that no concurrent
+            # update is lost between the read and the write.
+            cursor.execute("BEGIN IMMEDIATE;")
+            cursor.execute(
+                f"SELECT properties FROM {config['table']} {where_sql}", (entity_id,)
             )
-        with connection:
-            connection.executemany(sql, data_generator)
+            row = cursor.fetchone()
+            if row is None:
+                return False
+            merged = loads(row[0])
+            merged.update(properties)
+            for key in removed_keys:
+                merged.pop(key, None)
+            cursor.execute(
+                f"UPDATE {config['table']} SET properties = ? {where_sql}",
+                (dumps(merged), entity_id),
+            )
+        return True
 
     def remove_properties(
         self,
@@ -652,24 +788,25 @@ class GraphDB:
         entity_id : int or None
             The ID of the entity (required for NODE and EDGE, ignored for GRAPH).
         """
-        connection = self._validate_connection()
+        cursor = self._validate_cursor()
         if not keys:
             return
-        key_placeholders = ",".join("?" * len(keys))
+        size = bucket_size(len(keys))
+        # Removing the same key twice is a no-op, so repeat the last one.
+        padded_keys = [*keys, *[keys[-1]] * (size - len(keys))]
+        sql = build_remove_properties_sql(entity_type, size)
         params: tuple[Any, ...]
         if entity_type == EntityType.GRAPH:
-            sql = f"DELETE FROM graph_properties WHERE key IN ({key_placeholders})"
-            params = tuple(keys)
+            params = tuple(padded_keys)
         else:
             if entity_id is None:
                 raise ValueError("entity_id must be provided for nodes and edges.")
-            config = _ENTITY_CONFIG[entity_type]
-            props_table = config["props_table"]
-            id_col = config["id_col"]
-            sql = f"DELETE FROM {props_table} WHERE {id_col} = ? AND key IN ({key_placeholders})"
-            params = (entity_id, *keys)
-        with connection:
-            connection.execute(sql, params)
+            if not all(has_json_path(key) for key in keys):
+                self._rewrite_properties(entity_type, entity_id, {}, keys)
+                return
+            params = (*(json_path(key) for key in padded_keys), entity_id)
+        with cursor.connection:
+            cursor.execute(sql, params)
 
     def get_properties(
         self, entity_type: EntityType, entity_id: int | None = None
@@ -689,22 +826,22 @@ class GraphDB:
         dict[str, Any]
             The properties of the entity.
         """
-        connection = self._validate_connection()
-        params: tuple[Any, ...]
+        cursor = self._validate_cursor()
         if entity_type == EntityType.GRAPH:
-            sql = "SELECT key, value FROM graph_properties"
-            params = ()
-        else:
-            if entity_id is None:
-                raise ValueError("entity_id must be provided for nodes and edges.")
-            config = _ENTITY_CONFIG[entity_type]
-            props_table = config["props_table"]
-            id_col = config["id_col"]
-            sql = f"SELECT key, value FROM {props_table} WHERE {id_col} = ?"
-            params = (entity_id,)
-        cursor = connection.cursor()
-        cursor.execute(sql, params)
-        return {key: json.loads(value) for key, value in cursor}
+            # Let SQLite assemble the object so it is decoded in a single call.
+            cursor.execute(
+                "SELECT json_group_object(key, json(value)) FROM graph_properties"
+            )
+            return loads(cursor.fetchone()[0])
+        if entity_id is None:
+            raise ValueError("entity_id must be provided for nodes and edges.")
+        config = ENTITY_CONFIG[entity_type]
+        cursor.execute(
+            f"SELECT properties FROM {config['table']} WHERE {config['id_col']} = ?",
+            (entity_id,),
+        )
+        row = cursor.fetchone()
+        return loads(row[0]) if row else {}
 
     def delete_node(self, node_id: int) -> None:
         """
@@ -714,11 +851,29 @@ class GraphDB:
         ----------
         node_id : int
             The ID of the node to delete.
+
+        See Also
+        --------
+        delete_nodes : Delete many nodes in a single statement.
         """
-        connection = self._validate_connection()
-        sql = "DELETE FROM nodes WHERE node_id = ?"
-        with connection:
-            connection.execute(sql, (node_id,))
+        self.delete_nodes([node_id])
+
+    def delete_nodes(self, node_ids: list[int]) -> None:
+        """
+        Delete several nodes and their associated edges in one statement.
+
+        The IDs are bound as a single JSON array, so the whole batch is
+        removed by one statement in one transaction.
+
+        Parameters
+        ----------
+        node_ids : list[int]
+            The IDs of the nodes to delete. Unknown IDs are ignored.
+        """
+        cursor = self._validate_cursor()
+        sql = "DELETE FROM nodes WHERE node_id IN (SELECT value FROM json_each(?))"
+        with cursor.connection:
+            cursor.execute(sql, (dumps(node_ids),))
 
     def delete_edge(self, edge_id: int) -> None:
         """
@@ -728,11 +883,72 @@ class GraphDB:
         ----------
         edge_id : int
             The ID of the edge to delete.
+
+        See Also
+        --------
+        delete_edges : Delete many edges in a single statement.
         """
-        connection = self._validate_connection()
-        sql = "DELETE FROM edges WHERE edge_id = ?"
-        with connection:
-            connection.execute(sql, (edge_id,))
+        self.delete_edges([edge_id])
+
+    def delete_edges(self, edge_ids: list[int]) -> None:
+        """
+        Delete several edges from the graph in one statement.
+
+        The IDs are bound as a single JSON array, so the whole batch is
+        removed by one statement in one transaction.
+
+        Parameters
+        ----------
+        edge_ids : list[int]
+            The IDs of the edges to delete. Unknown IDs are ignored.
+        """
+        cursor = self._validate_cursor()
+        sql = "DELETE FROM edges WHERE edge_id IN (SELECT value FROM json_each(?))"
+        with cursor.connection:
+            cursor.execute(sql, (dumps(edge_ids),))
+
+    @contextlib.contextmanager
+    def bulk_load(self) -> Iterator[Self]:
+        """
+        Suspend secondary indexes while loading many entities.
+
+        Maintaining every index on each insert is much slower than building
+        it once over the loaded data. On entry, all non-unique indexes are
+        dropped; on exit, even if an exception was raised, they are
+        recreated from their original definitions and the planner
+        statistics are refreshed with ANALYZE.
+
+        Lookups, and deletions that cascade through edges, run without
+        index support inside the block.
+
+        Yields
+        ------
+        Self
+            The GraphDB instance itself.
+
+        Raises
+        ------
+        RuntimeError
+            If the database connection is not available.
+        """
+        cursor = self._validate_cursor()
+        cursor.execute(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE type = 'index' AND sql IS NOT NULL "
+            "AND sql NOT LIKE 'CREATE UNIQUE INDEX%'"
+        )
+        indexes = cursor.fetchall()
+        with cursor.connection:
+            for name, _ in indexes:
+                quoted_name = name.replace('"', '""')
+                cursor.execute(f'DROP INDEX "{quoted_name}"')
+        try:
+            yield self
+        finally:
+            with cursor.connection:
+                for _, sql in indexes:
+                    cursor.execute(sql)
+            cursor.execute("ANALYZE;")
 
     def __enter__(self) -> Self:
         """
@@ -0,0 +1,139 @@
+"""
+Define the entity types of the property graph.
+
+Classes
+-------
+NodeDict
+    TypedDict representing a node in the property graph.
+EdgeDict
+    TypedDict representing an edge in the property graph.
+EntityType
+    Enum for entity types (node, edge, graph).
+EntityConfigDict
+    TypedDict for entity configuration metadata.
+"""
+
+from enum import StrEnum
+from typing import Any, TypedDict
+
+__all__ = [
+    "EntityType",
+    "EntityConfigDict",
+    "ENTITY_CONFIG",
+    "NodeDict",
+    "EdgeDict",
+]
+
+
+class NodeDict(TypedDict):
+    """
+    Represent the structure of a node in a property graph.
+
+    Attributes
+    ----------
+    id : int
+        Unique identifier for the node.
+    label : str
+        Label or name of the node.
+    properties : dict[str, Any]
+        Dictionary containing additional properties or metadata
+        associated with the node.
+    """
+
+    id: int
+    label: str
+    properties: dict[str, Any]
+
+
+class EdgeDict(TypedDict):
+    """
+    Represent the structure of an edge in a property graph.
+
+    Attributes
+    ----------
+    id : int
+        Unique identifier for the edge.
+    source_id : int
+        Unique identifier of the source node of the edge.
+    target_id : int
+        Unique identifier of the target node of the edge.
+    label : str
+        Label describing the edge.
+    properties : dict[str, Any]
+        Dictionary containing additional properties of the edge.
+    """
+
+    id: int
+    source_id: int
+    target_id: int
+    label: str
+    properties: dict[str, Any]
+
+
+class EntityType(StrEnum):
+    """
+    Enumerate entity types in the property graph.
+
+    Members
+    -------
+    NODE : str
+        Represents a node entity.
+    EDGE : str
+        Represents an edge entity.
+    GRAPH : str
+        Represents the graph itself (for graph-level properties).
+    """
+
+    NODE = "node"
+    EDGE = "edge"
+    GRAPH = "graph"
+
+
+class EntityConfigDict(TypedDict):
+    """
+    Describe the configuration for an entity type in the property graph.
+
+    Attributes
+    ----------
+    table : str
+        Table name for the entity.
+    alias : str
+        Table alias for SQL queries.
+    id_col : str
+        Primary key column name for the entity.
+    sql_fetch_select : str
+        SQL SELECT clause for fetching the entity.
+    sql_fetch_from : str
+        SQL FROM clause for fetching the entity.
+    """
+
+    table: str
+    alias: str
+    id_col: str
+    sql_fetch_select: str
+    sql_fetch_from: str
+
+
+# Configuration for entity types in the property graph.
+# This dictionary maps each EntityType to its configuration metadata.
+# It includes table names, column names, and SQL query fragments.
+# Rows are turned back into entities by `sqlbuilder.rebuild_nodes` and
+# `sqlbuilder.rebuild_edges`.
+ENTITY_CONFIG: dict[EntityType, EntityConfigDict] = {
+    EntityType.NODE: {
+        "table": "nodes",
+        "alias": "n",
+        "id_col": "node_id",
+        "sql_fetch_select": "n.node_id, n.label, n.properties",
+        "sql_fetch_from": "nodes AS n",
+    },
+    EntityType.EDGE: {
+        "table": "edges",
+        "alias": "e",
+        "id_col": "edge_id",
+        "sql_fetch_select": (
+            "e.edge_id, e.source_id, e.target_id, e.label, e.properties"
+        ),
+        "sql_fetch_from": "edges AS e",
+    },
+}
@@ -0,0 +1,82 @@
+"""
+Encode and decode property values as JSON.
+
+The encoder is orjson when the optional dependency is installed, and the
+standard library `json` module otherwise. Both behave the same: NaN and
+infinities are rejected, dictionary keys are converted to strings,
+integers of any size round-trip exactly, and types outside JSON, such as
+UUIDs and plain enum members, raise `TypeError`. Values orjson handles
+differently from `json` are handed over to `json`.
+
+Functions
+---------
+dumps
+    Serialize a value to a JSON string.
+loads
+    Deserialize a JSON string.
+"""
+
+import functools
+import json
+from typing import Any, Callable
+
+__all__ = ["dumps", "loads"]
+
+# NaN and infinities are rejected, as they are not valid JSON. Non-ASCII text
+# is left unescaped so that JSON paths can address it (see
+# `sqlbuilder.has_json_path`).
+_json_dumps: Callable[[Any], str] = functools.partial(
+    json.dumps, ensure_ascii=False, allow_nan=False
+)
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library.
+    dumps = _json_dumps
+    loads: Callable[[str], Any] = json.loads
+else:
+    # orjson decodes integers outside the 64-bit range as floats, which are
+    # then at least this large in magnitude.
+    _LONG_INT_FLOAT = 2.0**63
+    _SCALAR_TYPES = frozenset({str, int, bool, type(None)})
+
+    def _holds_long_int_float(value: Any) -> bool:
+        """Return whether a decoded object or array holds a float >= 2**63."""
+        items = value.values() if isinstance(value, dict) else value
+        # Most objects hold no floats or nested values; skip them in C.
+        if _SCALAR_TYPES.issuperset(map(type, items)):
+            return False
+        for item in items:
+            item_type = type(item)
+            if item_type is float:
+                if abs(item) >= _LONG_INT_FLOAT:
+                    return True
+            elif item_type is dict or item_type is list:
+                if _holds_long_int_float(item):
+                    return True
+        return False
+
+    def dumps(value: Any) -> str:
+        """Serialize a value to a JSON string, using orjson where it agrees."""
+        try:
+            encoded = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # E.g. integers beyond 64 bits, which only the standard library
+            # encodes; it raises the same error for unsupported types.
+            return _json_dumps(value)
+        # orjson also encodes values that json rejects: NaN and infinities
+        # (as null), UUIDs, enum members, dataclasses and datetimes. None of
+        # them decode back to an equal value, so leave them to json. The
+        # comparison runs in C and is far cheaper than encoding with json.
+        if orjson.loads(encoded) != value:
+            return _json_dumps(value)
+        return encoded.decode()
+
+    def loads(text: str) -> Any:
+        """Deserialize a JSON string, using orjson where it is exact."""
+        value = orjson.loads(text)
+        if isinstance(value, (dict, list)):
+            exact = not _holds_long_int_float(value)
+        else:
+            exact = not isinstance(value, float) or abs(value) < _LONG_INT_FLOAT
+        return value if exact else json.loads(text)
@@ -0,0 +1,358 @@
+"""
+Build the SQL statements of `GraphDB` and rebuild entities from their rows.
+
+Statements taking a variable number of parameters are padded to a few
+fixed sizes and cached, so that SQLite can reuse their prepared form.
+Property filters address the JSON ``properties`` column of nodes and edges
+with JSON paths where possible.
+"""
+
+import functools
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .entities import ENTITY_CONFIG, EdgeDict, EntityType, NodeDict
+from .jsoncodec import dumps, loads
+
+__all__ = [
+    "rebuild_nodes",
+    "rebuild_edges",
+    "json_path",
+    "has_json_path",
+    "json_type",
+    "build_property_filters",
+    "bucket_size",
+    "build_fetch_sql",
+    "build_set_properties_sql",
+    "build_remove_properties_sql",
+    "build_find_nodes_query",
+    "build_find_edges_query",
+]
+
+
+def rebuild_nodes(rows: Iterable[tuple[Any, ...]]) -> Iterator[NodeDict]:
+    """
+    Reconstruct nodes from rows holding the node fetch columns.
+
+    Parameters
+    ----------
+    rows : Iterable[tuple[Any, ...]]
+        Rows selected with the node ``sql_fetch_select`` clause.
+
+    Yields
+    ------
+    NodeDict
+        The reconstructed nodes, in row order.
+    """
+    for node_id, label, properties in rows:
+        yield NodeDict(id=node_id, label=label, properties=loads(properties))
+
+
+def rebuild_edges(rows: Iterable[tuple[Any, ...]]) -> Iterator[EdgeDict]:
+    """
+    Reconstruct edges from rows holding the edge fetch columns.
+
+    Parameters
+    ----------
+    rows : Iterable[tuple[Any, ...]]
+        Rows selected with the edge ``sql_fetch_select`` clause.
+
+    Yields
+    ------
+    EdgeDict
+        The reconstructed edges, in row order.
+    """
+    for edge_id, source_id, target_id, label, properties in rows:
+        yield EdgeDict(
+            id=edge_id,
+            source_id=source_id,
+            target_id=target_id,
+            label=label,
+            properties=loads(properties),
+        )
+
+
+def json_path(key: str) -> str:
+    """
+    Return the JSON path addressing a top-level key of a JSON object.
+
+    Parameters
+    ----------
+    key : str
+        The property key. It must satisfy `has_json_path`.
+
+    Returns
+    -------
+    str
+        The JSON path, e.g. ``$.name`` or ``$."first name"``.
+    """
+    return f"$.{key}" if key.isidentifier() else f'$."{key}"'
+
+
+def has_json_path(key: str) -> bool:
+    """
+    Return whether a top-level key of a JSON object can be addressed by a path.
+
+    SQLite matches path labels against the raw JSON text of object keys, and
+    a quoted label cannot contain ``"``. Keys whose JSON encoding needs escape
+    sequences, such as quotes, backslashes and control characters, are
+    therefore out of reach of `json_path`.
+
+    Parameters
+    ----------
+    key : str
+        The property key.
+
+    Returns
+    -------
+    bool
+        True if `json_path` addresses the key.
+    """
+    return key.isprintable() and '"' not in key and "\\" not in key
+
+
+# Range of SQLite's 64-bit INTEGER storage class; larger Python ints cannot
+# be bound as query parameters.
+_SQLITE_INT_MIN = -(2**63)
+_SQLITE_INT_MAX = 2**63 - 1
+
+
+# JSON type names reported by json_type(), by the Python type encoded.
+_JSON_TYPE_NAMES: tuple[tuple[type, str], ...] = (
+    (type(None), "null"),
+    (int, "integer"),
+    (float, "real"),
+    (str, "text"),
+    (dict, "object"),
+)
+
+
+def json_type(value: Any) -> str:
+    """
+    Return the type name SQLite's ``json_type`` gives a value's JSON encoding.
+
+    Parameters
+    ----------
+    value : Any
+        A JSON-serializable value.
+
+    Returns
+    -------
+    str
+        One of ``null``, ``true``, ``false``, ``integer``, ``real``, ``text``,
+        ``object`` or ``array``.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    for python_type, name in _JSON_TYPE_NAMES:
+        if isinstance(value, python_type):
+            return name
+    return "array"
+
+
+def _build_value_condition(
+    type_sql: str, value_sql: str, value: Any
+) -> tuple[str, list[Any]]:
+    """
+    Build an SQL condition matching a JSON value against a Python value.
+
+    Parameters
+    ----------
+    type_sql : str
+        SQL expression giving the ``json_type`` name of the JSON value.
+    value_sql : str
+        SQL expression giving the JSON value as ``json_extract`` returns it.
+    value : Any
+        The value to match.
+
+    Returns
+    -------
+    tuple[str, list[Any]]
+        The SQL condition and its query parameters.
+    """
+    type_condition = f"{type_sql} = '{json_type(value)}'"
+    if value is None or isinstance(value, bool):
+        # The type alone tells null, true and false apart.
+        return type_condition, []
+    if isinstance(value, (str, float)) or (
+        isinstance(value, int) and _SQLITE_INT_MIN <= value <= _SQLITE_INT_MAX
+    ):
+        # json_extract() yields scalars as SQL values, so these compare
+        # equal to the bound value itself without JSON encoding.
+        return f"{value_sql} = ? AND {type_condition}", [value]
+    return f"{value_sql} = json_extract(?, '$') AND {type_condition}", [dumps(value)]
+
+
+def build_property_filters(
+    alias: str, properties: dict[str, Any]
+) -> tuple[list[str], list[Any]]:
+    """
+    Build SQL conditions matching entities by their JSON properties.
+
+    Paths are inlined as SQL literals rather than bound, so that the
+    conditions can be served by expression indexes such as
+    ``json_extract(properties, '$.name')``. Scalar values are bound as is;
+    only arrays and objects are JSON-encoded. Since ``json_extract`` drops
+    the JSON type of its result, each condition also checks ``json_type``,
+    so that e.g. the string ``"[1,2]"`` does not match the array ``[1, 2]``.
+    Keys that no path can address are looked up with ``json_each`` instead.
+
+    Parameters
+    ----------
+    alias : str
+        Alias of the table holding the ``properties`` column.
+    properties : dict[str, Any]
+        Properties that must match. All must match (AND logic).
+
+    Returns
+    -------
+    tuple[list[str], list[Any]]
+        The SQL conditions and their query parameters.
+    """
+    clauses: list[str] = []
+    params: list[Any] = []
+    for key, value in properties.items():
+        if has_json_path(key):
+            path = json_path(key).replace("'", "''")
+            clause, value_params = _build_value_condition(
+                f"json_type({alias}.properties, '{path}')",
+                f"json_extract({alias}.properties, '{path}')",
+                value,
+            )
+        else:
+            condition, value_params = _build_value_condition("type", "value", value)
+            clause = (
+                f"EXISTS (SELECT 1 FROM json_each({alias}.properties) "
+                f"WHERE key = ? AND {condition})"
+            )
+            value_params.insert(0, key)
+        clauses.append(clause)
+        params.extend(value_params)
+    return clauses, params
+
+
+# Variable-length parameter lists are padded up to a power of two so that
+# calls of similar size share the same SQL text, and therefore the same
+# entry in the connection's prepared-statement cache.
+_MAX_BUCKET_SIZE = 1024
+
+
+def bucket_size(count: int) -> int:
+    """
+    Return the padded length for a parameter list of the given length.
+
+    Parameters
+    ----------
+    count : int
+        Number of parameters, at least 1.
+
+    Returns
+    -------
+    int
+        The next power of two, or `count` itself beyond `_MAX_BUCKET_SIZE`.
+    """
+    size = 1 << (count - 1).bit_length()
+    return size if size <= _MAX_BUCKET_SIZE else count
+
+
+@functools.lru_cache(maxsize=32)
+def build_fetch_sql(entity_type: EntityType, size: int) -> str:
+    """Build the SQL fetching up to `size` entities of a type by ID."""
+    config = ENTITY_CONFIG[entity_type]
+    id_placeholders = ",".join("?" * size)
+    entity_alias = config["alias"]
+    return f"""
+        SELECT {config['sql_fetch_select']}
+        FROM {config['sql_fetch_from']}
+        WHERE {entity_alias}.{config['id_col']} IN ({id_placeholders})
+        ORDER BY {entity_alias}.{config['id_col']}
+    """
+
+
+@functools.lru_cache(maxsize=32)
+def build_set_properties_sql(entity_type: EntityType, size: int) -> str:
+    """Build the SQL setting `size` properties of a node or edge."""
+    config = ENTITY_CONFIG[entity_type]
+    assignments = ", ".join(["?, json(?)"] * size)
+    return (
+        f"UPDATE {config['table']} "
+        f"SET properties = json_set(properties, {assignments}) "
+        f"WHERE {config['id_col']} = ?"
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def build_remove_properties_sql(entity_type: EntityType, size: int) -> str:
+    """Build the SQL removing `size` property keys from an entity."""
+    key_placeholders = ",".join("?" * size)
+    if entity_type == EntityType.GRAPH:
+        return f"DELETE FROM graph_properties WHERE key IN ({key_placeholders})"
+    config = ENTITY_CONFIG[entity_type]
+    return (
+        f"UPDATE {config['table']} "
+        f"SET properties = json_remove(properties, {key_placeholders}) "
+        f"WHERE {config['id_col']} = ?"
+    )
+
+
+def build_find_nodes_query(
+    label: str | None,
+    properties: dict[str, Any] | None,
+) -> tuple[str, tuple[Any, ...]]:
+    """Build the SQL query and parameters for finding nodes."""
+    query_params: list[Any] = []
+    where_clauses: list[str] = []
+
+    if label is not None:
+        where_clauses.append("n.label = ?")
+        query_params.append(label)
+    if properties:
+        prop_clauses, prop_params = build_property_filters("n", properties)
+        where_clauses.extend(prop_clauses)
+        query_params.extend(prop_params)
+
+    config = ENTITY_CONFIG[EntityType.NODE]
+    where_sql = " AND ".join(where_clauses)
+    where_sql = f"WHERE {where_sql}" if where_clauses else ""
+    sql = f"""
+        SELECT {config['sql_fetch_select']} FROM {config['sql_fetch_from']}
+        {where_sql}
+        ORDER BY n.node_id
+    """
+    return sql, tuple(query_params)
+
+
+def build_find_edges_query(
+    source_node_id: int | None,
+    target_node_id: int | None,
+    label: str | None,
+    properties: dict[str, Any] | None,
+) -> tuple[str, tuple[Any, ...]]:
+    """Build the SQL query and parameters for finding edges."""
+    query_params: list[Any] = []
+    base_where_clauses: list[str] = []
+
+    if source_node_id is not None:
+        base_where_clauses.append("e.source_id = ?")
+        query_params.append(source_node_id)
+    if target_node_id is not None:
+        base_where_clauses.append("e.target_id = ?")
+        query_params.append(target_node_id)
+    if label is not None:
+        base_where_clauses.append("e.label = ?")
+        query_params.append(label)
+
+    if properties:
+        prop_clauses, prop_params = build_property_filters("e", properties)
+        base_where_clauses.extend(prop_clauses)
+        query_params.extend(prop_params)
+
+    config = ENTITY_CONFIG[EntityType.EDGE]
+    base_where_sql = " AND ".join(base_where_clauses)
+    where_sql = f"WHERE {base_where_sql}" if base_where_clauses else ""
+    sql = f"""
+        SELECT {config['sql_fetch_select']} FROM {config['sql_fetch_from']}
+        {where_sql}
+        ORDER BY e.edge_id
+    """
+    return sql, tuple(query_params)
@@ -1,7 +1,9 @@
 """Unit tests for the pygrafito.dataaccesslayer module, themed around TRON: Legacy."""
 
 import sqlite3
+import tempfile
 import unittest
+from pathlib import Path
 
 from ..dataaccesslayer import EntityType, GraphDB
 
@@ -9,10 +11,23 @@ from ..dataaccesslayer import EntityType, GraphDB
 class TestGraphDB(unittest.TestCase):
     """Test suite for the GraphDB data access layer, TRON-themed."""
 
+    template: GraphDB
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Initialize the schema once in an in-memory template database."""
+        cls.template = GraphDB(":memory:")
+        cls.template.connect()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Close the template database."""
+        cls.template.close()
+
     def setUp(self) -> None:
-        """Set up a new in-memory database for each test."""
-        self.db = GraphDB(":memory:")
-        self.db.connect()
+        """Set up a new in-memory database for each test, copied from the
+        template."""
+        self.db = GraphDB.from_template(self.template)
 
     def tearDown(self) -> None:
         """Close the database connection after each test."""
@@ -55,6 +70,36 @@ class TestGraphDB(unittest.TestCase):
         )
         self.assertDictEqual(props, retrieved_props)
 
+    def test_create_nodes_and_edges_in_bulk(self) -> None:
+        """Test creating the Flynn family and their Grid creations in one batch."""
+        kevin_id, sam_id, clu_id = self.db.create_nodes(
+            [
+                ("Person", {"name": "Kevin Flynn"}),
+                ("Person", {"name": "Sam Flynn"}),
+                ("Program", None),
+            ]
+        )
+        self.assertEqual([kevin_id, sam_id, clu_id], [1, 2, 3])
+        self.assertEqual(self.db.get_properties(EntityType.NODE, clu_id), {})
+
+        edge_ids = self.db.create_edges(
+            [
+                (kevin_id, sam_id, "FATHER_OF", {"since": "birth"}),
+                (kevin_id, clu_id, "CREATED", None),
+            ]
+        )
+        self.assertEqual(edge_ids, [1, 2])
+        self.assertDictEqual(
+            self.db.get_properties(EntityType.EDGE, edge_ids[0]), {"since": "birth"}
+        )
+
+        # A dangling endpoint rolls back the whole batch.
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.create_edges(
+                [(sam_id, kevin_id, "SON_OF", None), (sam_id, 99, "KNOWS", None)]
+            )
+        self.assertEqual(self.db.find_edges(label="SON_OF"), [])
+
     def test_foreign_key_constraint_on_edge(self) -> None:
         """Test that creating an edge to a non-existent User fails."""
         with self.assertRaises(sqlite3.IntegrityError):
@@ -76,6 +121,107 @@ class TestGraphDB(unittest.TestCase):
         self.assertEqual(len(sam_node), 1)
         self.assertEqual(sam_node[0]["id"], 2)
 
+        with self.assertRaises(ValueError):
+            self.db.find_nodes(properties={})
+        with self.assertRaises(ValueError):
+            self.db.find_edges(properties={})
+
+    def test_get_node_and_edge(self) -> None:
+        """Test looking up Kevin Flynn and his creation of CLU by ID."""
+        kevin_id = self.db.create_node("Person", {"name": "Kevin Flynn"})
+        clu_id = self.db.create_node("Program", {"name": "CLU"})
+        edge_id = self.db.create_edge(kevin_id, clu_id, "CREATED", {"year": 1982})
+
+        self.assertEqual(
+            self.db.get_node(kevin_id),
+            {"id": kevin_id, "label": "Person", "properties": {"name": "Kevin Flynn"}},
+        )
+        self.assertEqual(
+            self.db.get_edge(edge_id),
+            {
+                "id": edge_id,
+                "source_id": kevin_id,
+                "target_id": clu_id,
+                "label": "CREATED",
+                "properties": {"year": 1982},
+            },
+        )
+        self.assertIsNone(self.db.get_node(99))
+        self.assertIsNone(self.db.get_edge(99))
+
+    def test_find_nodes_by_json_properties(self) -> None:
+        """Test matching nodes on nested, numeric, and null property values."""
+        clu_id = self.db.create_node(
+            "Program",
+            {"name": "CLU", "version": 2.0, "user": None, "disc": {"rings": [1, 2]}},
+        )
+        self.db.create_node("Program", {"name": "Tron", "version": 1.0, "user": "Alan"})
+
+        self.assertEqual(
+            [n["id"] for n in self.db.find_nodes(properties={"version": 2.0})],
+            [clu_id],
+        )
+        self.assertEqual(
+            [n["id"] for n in self.db.find_nodes(properties={"user": None})],
+            [clu_id],
+        )
+        found = self.db.find_nodes(
+            label="Program", properties={"disc": {"rings": [1, 2]}, "name": "CLU"}
+        )
+        self.assertEqual(len(found), 1)
+        self.assertEqual(found[0]["properties"]["disc"], {"rings": [1, 2]})
+        self.assertEqual(self.db.find_nodes(properties={"missing": None}), [])
+
+        sark_id = self.db.create_node(
+            "Program", {"name": "Sark", "derezzed": True, "cycles": 2**70}
+        )
+        found = self.db.find_nodes(properties={"derezzed": True, "cycles": 2**70})
+        self.assertEqual([n["id"] for n in found], [sark_id])
+        self.assertEqual(found[0]["properties"]["cycles"], 2**70)
+
+    def test_find_nodes_distinguishes_json_types(self) -> None:
+        """Test that property filters only match values of the same JSON type."""
+        disc_id, text_id, flag_id, one_id = self.db.create_nodes(
+            [
+                ("Disc", {"data": {"rings": [1, 2]}, "sectors": [1, 2]}),
+                ("Disc", {"data": '{"rings": [1, 2]}', "sectors": "[1, 2]"}),
+                ("Disc", {"active": True}),
+                ("Disc", {"active": 1}),
+            ]
+        )
+
+        def find_ids(properties: dict) -> list[int]:
+            return [n["id"] for n in self.db.find_nodes(properties=properties)]
+
+        self.assertEqual(find_ids({"data": {"rings": [1, 2]}}), [disc_id])
+        self.assertEqual(find_ids({"data": '{"rings": [1, 2]}'}), [text_id])
+        self.assertEqual(find_ids({"sectors": [1, 2]}), [disc_id])
+        self.assertEqual(find_ids({"sectors": "[1, 2]"}), [text_id])
+        self.assertEqual(find_ids({"active": True}), [flag_id])
+        self.assertEqual(find_ids({"active": 1}), [one_id])
+
+    def test_iter_nodes_and_edges(self) -> None:
+        """Test streaming the Programs on the Grid and their relationships."""
+        tron_id, clu_id, rinzler_id = self.db.create_nodes(
+            [
+                ("Program", {"name": "Tron"}),
+                ("Program", {"name": "CLU"}),
+                ("Program", {"name": "Rinzler"}),
+            ]
+        )
+        self.db.create_edge(clu_id, rinzler_id, "REPURPOSED", {"from": "Tron"})
+
+        programs = self.db.iter_nodes(label="Program")
+        self.assertEqual(next(programs)["id"], tron_id)
+        self.assertEqual([n["id"] for n in programs], [clu_id, rinzler_id])
+
+        edges = list(self.db.iter_edges(source_node_id=clu_id))
+        self.assertEqual(len(edges), 1)
+        self.assertEqual(edges[0]["properties"], {"from": "Tron"})
+
+        with self.assertRaises(ValueError):
+            self.db.iter_edges()
+
     def test_find_edges(self) -> None:
         """Test finding specific relationships in the Grid."""
         kevin_id = self.db.create_node("Person", {"name": "Kevin Flynn"})
@@ -86,6 +232,28 @@ class TestGraphDB(unittest.TestCase):
         creations = self.db.find_edges(source_node_id=kevin_id)
         self.assertEqual(len(creations), 1)
 
+    def test_find_edges_requires_all_properties(self) -> None:
+        """Test that edge property filters are ANDed with each other and the
+        endpoints."""
+        kevin_id = self.db.create_node("Person", {"name": "Kevin Flynn"})
+        clu_id = self.db.create_node("Program", {"name": "CLU"})
+        tron_id = self.db.create_node("Program", {"name": "Tron"})
+        clu_edge_id, _, _ = self.db.create_edges(
+            [
+                (kevin_id, clu_id, "CREATED", {"year": 1982, "place": "ENCOM"}),
+                (kevin_id, tron_id, "CREATED", {"year": 1982, "place": "Grid"}),
+                (tron_id, clu_id, "FOUGHT", {"year": 1982, "place": "ENCOM"}),
+            ]
+        )
+
+        found = self.db.find_edges(
+            source_node_id=kevin_id, properties={"year": 1982, "place": "ENCOM"}
+        )
+        self.assertEqual([e["id"] for e in found], [clu_edge_id])
+        self.assertEqual(
+            self.db.find_edges(properties={"year": 1982, "place": "Tron City"}), []
+        )
+
     # --- Update / Delete Property Tests ---
 
     def test_clu_properties_evolution(self) -> None:
@@ -120,6 +288,72 @@ class TestGraphDB(unittest.TestCase):
             self.db.get_properties(entity_type=EntityType.NODE, entity_id=clu_id),
         )
 
+    def test_set_properties_round_trips_values(self) -> None:
+        """Test that Rinzler's updated properties come back exactly as set."""
+        rinzler_id = self.db.create_node("Program", {"name": "Tron"})
+        props = {
+            "name": "Rinzler",
+            "loyalty": 1 / 3,
+            "rectified": True,
+            "user": None,
+            "discs": [{"id": 1}, {"id": 2}],
+            "grid sector": 7,
+        }
+        self.db.set_properties(EntityType.NODE, props, rinzler_id)
+        self.assertDictEqual(self.db.get_properties(EntityType.NODE, rinzler_id), props)
+
+    def test_property_values_encode_as_json(self) -> None:
+        """Test that the Grid's sector map is stored as JSON and NaN is refused."""
+        grid_id = self.db.create_node("Grid", {"sectors": {7: "Arena"}})
+        self.assertDictEqual(
+            self.db.get_properties(EntityType.NODE, grid_id),
+            {"sectors": {"7": "Arena"}},
+        )
+        with self.assertRaises(ValueError):
+            self.db.create_node("Program", {"cycles": float("nan")})
+        with self.assertRaises(ValueError):
+            self.db.set_properties(EntityType.NODE, {"cycles": float("inf")}, grid_id)
+
+    def test_set_properties_of_missing_entity(self) -> None:
+        """Test that properties cannot be set on a derezzed Program."""
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.set_properties(EntityType.NODE, {"name": "Tron"}, 99)
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.set_properties(EntityType.EDGE, {'say "hi"': 1}, 99)
+
+    def test_properties_with_escaped_keys(self) -> None:
+        """Test keys that need escaping in JSON, as in CLU's corrupted records."""
+        keys = ['say "hi"', "C:\\GRID", "tab\there", "año"]
+        clu_id = self.db.create_node("Program", {key: 1 for key in keys})
+        self.db.create_node("Program", {key: 2 for key in keys})
+
+        for key in keys:
+            found = self.db.find_nodes(properties={key: 1})
+            self.assertEqual([n["id"] for n in found], [clu_id])
+
+        self.db.set_properties(EntityType.NODE, {key: 3 for key in keys}, clu_id)
+        self.assertDictEqual(
+            self.db.get_properties(EntityType.NODE, clu_id), {key: 3 for key in keys}
+        )
+
+        self.db.remove_properties(EntityType.NODE, keys[:3], clu_id)
+        self.assertDictEqual(
+            self.db.get_properties(EntityType.NODE, clu_id), {"año": 3}
+        )
+
+    def test_remove_several_properties(self) -> None:
+        """Test stripping several properties from Quorra and The Grid at once."""
+        quorra_props = {"name": "Quorra", "kind": "ISO", "age": 1000, "home": "Grid"}
+        quorra_id = self.db.create_node("ISO", quorra_props)
+        self.db.remove_properties(EntityType.NODE, ["kind", "age", "home"], quorra_id)
+        self.assertDictEqual(
+            self.db.get_properties(EntityType.NODE, quorra_id), {"name": "Quorra"}
+        )
+
+        self.db.set_properties(EntityType.GRAPH, {"a": 1, "b": 2, "c": 3, "d": 4})
+        self.db.remove_properties(EntityType.GRAPH, ["a", "b", "c"])
+        self.assertDictEqual(self.db.get_properties(EntityType.GRAPH), {"d": 4})
+
     def test_grid_metadata(self) -> None:
         """Test setting and removing graph-level metadata about The Grid."""
         # Updated call to get_properties
@@ -173,6 +407,89 @@ class TestGraphDB(unittest.TestCase):
         self.assertDictEqual(self.db.get_properties(EntityType.NODE, kevin_id), {})
         self.assertDictEqual(self.db.get_properties(EntityType.EDGE, e1_id), {})
 
+    def test_delete_programs_in_bulk(self) -> None:
+        """Test derezzing several Programs and relationships at once."""
+        kevin_id, clu_id, tron_id, rinzler_id = self.db.create_nodes(
+            [("Person", None), ("Program", None), ("Program", None), ("Program", None)]
+        )
+        created_clu, created_tron, _ = self.db.create_edges(
+            [
+                (kevin_id, clu_id, "CREATED", None),
+                (kevin_id, tron_id, "CREATED", None),
+                (clu_id, rinzler_id, "REPURPOSED", None),
+            ]
+        )
+
+        self.db.delete_edges([created_clu, created_tron, 99])
+        self.assertEqual(self.db.find_edges(label="CREATED"), [])
+
+        self.db.delete_nodes([clu_id, rinzler_id])
+        remaining = self.db.find_nodes(label="Program")
+        self.assertEqual([n["id"] for n in remaining], [tron_id])
+        self.assertEqual(self.db.find_edges(label="REPURPOSED"), [])
+
+
+class TestGraphDBConnection(unittest.TestCase):
+    """Test suite for GraphDB connection setup and database copies."""
+
+    def _journal_mode(self, fast: bool) -> str:
+        """Open a Grid database file and return its persisted journal mode."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = Path(tmp_dir) / "grid.db"
+            with GraphDB(db_path, fast=fast) as db:
+                db.create_node("Program", {"name": "Tron"})
+            connection = sqlite3.connect(db_path)
+            try:
+                return connection.execute("PRAGMA journal_mode;").fetchone()[0]
+            finally:
+                connection.close()
+
+    def test_fast_connection_uses_wal(self) -> None:
+        """Test that the Grid is journaled with WAL by default."""
+        self.assertEqual(self._journal_mode(fast=True), "wal")
+
+    def test_slow_connection_keeps_default_journal(self) -> None:
+        """Test that opting out of fast mode leaves SQLite's default journal."""
+        self.assertEqual(self._journal_mode(fast=False), "delete")
+
+    def test_from_template_copies_contents(self) -> None:
+        """Test that a copied Grid starts with the template's Programs and then
+        diverges from it."""
+        with GraphDB(":memory:") as grid:
+            tron_id = grid.create_node("Program", {"name": "Tron"})
+            with GraphDB.from_template(grid) as copy:
+                self.assertEqual(copy.find_nodes("Program")[0]["id"], tron_id)
+                copy.create_node("Program", {"name": "CLU"})
+                self.assertEqual(len(copy.find_nodes("Program")), 2)
+            self.assertEqual(len(grid.find_nodes("Program")), 1)
+
+    def _index_names(self, db_path: Path) -> set[str]:
+        """Return the names of the explicitly created indexes of a database."""
+        connection = sqlite3.connect(db_path)
+        try:
+            rows = connection.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'index' AND sql IS NOT NULL"
+            )
+            return {name for (name,) in rows}
+        finally:
+            connection.close()
+
+    def test_bulk_load_restores_indexes(self) -> None:
+        """Test that indexes are suspended while loading the Grid's Programs."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = Path(tmp_dir) / "grid.db"
+            with GraphDB(db_path) as db:
+                original_indexes = self._index_names(db_path)
+                with db.bulk_load():
+                    self.assertEqual(self._index_names(db_path), set())
+                    db.create_nodes(
+                        [("Program", {"name": f"P{i}"}) for i in range(100)]
+                    )
+                self.assertEqual(self._index_names(db_path), original_indexes)
+                found = db.find_nodes("Program", {"name": "P42"})
+                self.assertEqual([n["id"] for n in found], [43])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,48 @@
+"""Unit tests for the pygrafito.jsoncodec module, themed around TRON: Legacy."""
+
+import enum
+import json
+import unittest
+import uuid
+
+from ..jsoncodec import dumps, loads
+
+
+class TestJSONCodec(unittest.TestCase):
+    """Test suite for encoding and decoding property values."""
+
+    def test_round_trips_like_json(self) -> None:
+        """Test that Sark's records decode back to what the json module reads."""
+        record = {"name": "Sark", "cycles": 2**70, "debt": -(2**63) - 1, "año": 1}
+        record["log"] = [1.5, {"cycles": [2**64, None]}]
+        encoded = dumps(record)
+        self.assertEqual(json.loads(encoded), record)
+        self.assertEqual(loads(encoded), record)
+
+    def test_stringifies_keys(self) -> None:
+        """Test that the Grid's numbered sectors are stored under string keys."""
+        self.assertEqual(
+            loads(dumps({7: "Arena", True: "Sea"})), {"7": "Arena", "true": "Sea"}
+        )
+
+    def test_rejects_non_finite_numbers(self) -> None:
+        """Test that corrupted cycle counts are refused rather than nulled."""
+        for value in (float("nan"), float("inf"), [1.0, float("-inf")]):
+            with self.assertRaises(ValueError):
+                dumps(value)
+
+    def test_rejects_types_outside_json(self) -> None:
+        """Test that Program IDs and disc colours must be converted by the
+        caller."""
+
+        class Color(enum.Enum):
+            """Colours of identity discs."""
+
+            BLUE = "blue"
+
+        for value in (uuid.UUID(int=1982), Color.BLUE, {"disc": [Color.BLUE]}):
+            with self.assertRaises(TypeError):
+                dumps(value)
+        self.assertEqual(
+            loads(dumps({Color.BLUE.value: ("Tron", None)})), {"blue": ["Tron", None]}
+        )